@@ -1,70 +1,199 @@
 #!/usr/bin/env python3
 
+import codecs
 import curses
 import os
 import subprocess
+import shutil
 import signal
+import sys
 import time
 import random
 import threading
 import argparse
+import hashlib
+import heapq
+import json
+import locale
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Constants
 MAX_FILES = 1024
-REFRESH_DELAY = 0.05  # 50ms in seconds
+INPUT_TIMEOUT_MS = 100  # getch timeout while playing or in shuffle mode
+IDLE_INPUT_TIMEOUT_MS = 500  # getch timeout when nothing is playing
+MAX_PENDING_KEYS = 64  # Keys handled per redraw when input arrives in a burst
+MIN_TRACK_SECONDS = 1.0  # Tracks ending sooner than this count as failed
+MAX_SHUFFLE_FAILURES = 5  # Failed tracks in a row before shuffle gives up
 MAX_FILENAME_LEN = 256
 
-# Audio/video file extensions
-MEDIA_EXTENSIONS = {
+# Media players in order of preference, with their arguments
+PLAYERS = [
+    ('mpv', ['--no-terminal', '--quiet']),
+    ('mplayer', ['-quiet']),
+    ('vlc', ['--intf', 'dummy']),
+]
+
+# Scanned file lists are cached here, keyed by directory
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mpv_tui'
+# Directory mtimes this close to the scan may not reflect every change yet
+# (FAT stores mtimes in 2 second steps), so such scans are not cached
+CACHE_RACY_NS = 3 * 1000000000
+
+# DEC synchronized output (mode 2026): the terminal holds the frame
+# between BSU and ESU and paints it in one go
+SYNC_OUTPUT_QUERY = "\x1b[?2026$p"
+SYNC_OUTPUT_BEGIN = b"\x1b[?2026h"
+SYNC_OUTPUT_END = b"\x1b[?2026l"
+# Primary device attributes: every terminal answers it, after any earlier reply
+DA1_QUERY = "\x1b[c"
+SYNC_PROBE_FIRST_BYTE_MS = 150  # Wait for a terminal that may not answer at all
+SYNC_PROBE_TIMEOUT_MS = 1000  # Max wait for each further byte once a reply has started
+SYNC_PROBE_MAX_SECONDS = 1.5  # Cap on the whole probe
+
+# Audio/video file extensions (lowercase, matched case-insensitively)
+MEDIA_EXTENSIONS = frozenset(ext.lower() for ext in (
     '.mp3', '.flac', '.wav', '.ogg', '.m4a', '.aac', '.wma', '.opus',
     '.mp4', '.avi', '.mkv', '.mov', '.webm'
-}
+))
 
 class PlayerState:
-    """Global state management"""
+    """Global state management
+
+    No lock is used: assigning or reading a single attribute, such as the
+    Optional[Popen] in mpv_process, is atomic in CPython under the GIL.
+    """
+    __slots__ = ("mpv_process", "child_finished", "redraw_event")
+
     def __init__(self):
-        self.child_finished = False
         self.mpv_process: Optional[subprocess.Popen] = None
-        self.needs_redraw = True
-        self.lock = threading.Lock()
-
-    def set_process(self, process: Optional[subprocess.Popen]):
-        with self.lock:
-            self.mpv_process = process
+        self.child_finished = False
+        self.redraw_event = threading.Event()
+        self.redraw_event.set()
 
-    def get_process(self) -> Optional[subprocess.Popen]:
-        with self.lock:
-            return self.mpv_process
+    @property
+    def is_playing(self) -> bool:
+        return self.mpv_process is not None
 
 class MediaPlayer:
     def __init__(self, directory: str = "."):
         self.state = PlayerState()
         self.directory = Path(directory).resolve()
+        self._dir_str = str(self.directory)  # The directory never changes
+        self._dir_display_cache: Dict[int, str] = {}  # term_x -> directory line
         self.files: List[str] = []
         self.highlight = 0
         self.start_index = 0
         self.shuffle_mode = False
         self.stdscr = None
 
-        # Start background thread to monitor child processes
-        self.monitor_thread = threading.Thread(target=self._monitor_processes, daemon=True)
-        self.monitor_thread.start()
+        # Resolve the media player once instead of trying each one per track
+        self._player_argv: Optional[List[str]] = None
+        for cmd, args in PLAYERS:
+            path = shutil.which(cmd)
+            if path:
+                self._player_argv = [path] + args
+                break
 
-    def _monitor_processes(self):
-        """Background thread to monitor child processes"""
-        while True:
-            process = self.state.get_process()
-            if process and process.poll() is not None:
-                self.state.set_process(None)
-                self.state.child_finished = True
-                self.state.needs_redraw = True
-            time.sleep(0.1)
-
-    def is_media_file(self, filename: str) -> bool:
+        # Redraw bookkeeping: which regions changed since the last frame
+        self._last_size = None
+        self._drawn_highlight: Optional[int] = None
+        self._pad = None  # Off-screen window holding every file list row
+        self._pad_width = 0
+        self._display_names: List[str] = []  # Filenames truncated to _display_names_width
+        self._display_names_width = -1
+        self.status_dirty = True
+        self.list_dirty = True
+        self._sync_output = False
+
+        # Box drawing characters can be written as plain text on UTF-8
+        # terminals, which takes one addstr per row
+        self._unicode_borders = codecs.lookup(locale.getpreferredencoding(False)).name == 'utf-8'
+
+        # Shuffle plays through a random permutation so no track repeats
+        # until every file has been played. Seeding from the clock avoids
+        # reading os.urandom at startup.
+        self._rng = random.Random(int(time.time() * 1000000) ^ os.getpid())
+        self._shuffle_order: List[int] = []
+        self._last_played: Optional[str] = None
+
+        # A player that exits at once (unplayable file, broken audio output)
+        # would otherwise be respawned as fast as SIGCHLD arrives
+        self._play_started = 0.0
+        self._last_returncode: Optional[int] = None
+        self._shuffle_failures = 0
+        self._shuffle_resume_at: Optional[float] = None
+        self._shuffle_gave_up = False
+
+    def _on_sigchld(self, signum, frame):
+        """SIGCHLD handler: notice when the current player exits"""
+        # Runs in the main thread between bytecodes, so it must not take
+        # any lock the interrupted code may be holding. Event.set() takes
+        # one, so the main loop requests the redraw when it sees
+        # child_finished.
+        self._check_player_exit()
+
+    def _check_player_exit(self):
+        """Mark the current player finished if it has exited"""
+        process = self.state.mpv_process
+        if process is not None and process.poll() is not None:
+            self._last_returncode = process.returncode
+            self.state.mpv_process = None
+            self.state.child_finished = True
+            self.status_dirty = True
+
+    @staticmethod
+    def is_media_file(filename: str, _ext=MEDIA_EXTENSIONS, _rfind=str.rfind) -> bool:
         """Check if file has media extension"""
-        return Path(filename).suffix.lower() in MEDIA_EXTENSIONS
+        # Plain string ops; a leading dot marks a hidden file, not an extension
+        i = _rfind(filename, '.')
+        return i > 0 and filename[i:].lower() in _ext
+
+    def _cache_path(self) -> Path:
+        """Path of the file list cache for the current directory"""
+        digest = hashlib.sha1(self._dir_str.encode('utf-8', 'surrogateescape')).hexdigest()
+        return CACHE_DIR / f"{digest}.json"
+
+    def _read_file_cache(self, mtime_ns: int) -> Optional[List[str]]:
+        """Return the cached file list if it is still valid"""
+        try:
+            with open(self._cache_path(), encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Adding, removing or renaming entries updates the directory mtime
+        if (not isinstance(data, dict) or
+                data.get('mtime_ns') != mtime_ns or
+                data.get('extensions') != sorted(MEDIA_EXTENSIONS) or
+                data.get('max_files') != MAX_FILES):
+            return None
+
+        files = data.get('files')
+        if not isinstance(files, list):
+            return None
+        return files
+
+    def _write_file_cache(self, mtime_ns: int):
+        """Store the current file list, ignoring any errors"""
+        path = self._cache_path()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        data = {
+            'mtime_ns': mtime_ns,
+            'extensions': sorted(MEDIA_EXTENSIONS),
+            'max_files': MAX_FILES,
+            'files': self.files,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)  # Atomic, readers never see a partial file
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     def load_media_files(self) -> int:
         """Load media files from specified directory"""
@@ -79,16 +208,30 @@ class MediaPlayer:
             original_cwd = Path.cwd()
             os.chdir(self.directory)
 
-            entries = os.listdir('.')
-            self.files = []
-
-            for entry in entries:
-                if (os.path.isfile(entry) and
-                    not entry.startswith('.') and
-                    self.is_media_file(entry)):
-                    self.files.append(entry)
-
-            self.files.sort()  # Sort alphabetically
+            # Skip the scan entirely if the directory is unchanged
+            mtime_ns = os.stat(self.directory).st_mtime_ns
+            cached = self._read_file_cache(mtime_ns)
+            if cached is not None:
+                self.files = cached
+                return len(self.files)
+
+            scan_started_ns = int(time.time() * 1000000000)
+
+            # DirEntry.is_file() uses the type reported by readdir(), so
+            # regular files need no extra stat() call. Only the first
+            # MAX_FILES names in alphabetical order are kept.
+            with os.scandir(self.directory) as entries:
+                self.files = heapq.nsmallest(MAX_FILES, (
+                    entry.name for entry in entries
+                    if not entry.name.startswith('.') and
+                    entry.is_file() and
+                    self.is_media_file(entry.name)
+                ))
+
+            # A file added later in the same mtime step would leave the
+            # mtime unchanged and stay hidden until the next change
+            if mtime_ns < scan_started_ns - CACHE_RACY_NS:
+                self._write_file_cache(mtime_ns)
             return len(self.files)
 
         except (OSError, PermissionError) as e:
@@ -103,44 +246,48 @@ class MediaPlayer:
         """Play media file using available player"""
         self.stop_playback()
 
-        # Use absolute path to ensure correct file is played
-        filepath = self.directory / filename
-
-        # Try different media players in order of preference
-        players = [
-            ['mpv', '--no-terminal', '--quiet', str(filepath)],
-            ['mplayer', '-quiet', str(filepath)],
-            ['vlc', '--intf', 'dummy', str(filepath)]
-        ]
+        if self._player_argv is None:
+            return False
 
-        for player_cmd in players:
-            try:
-                process = subprocess.Popen(
-                    player_cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    stdin=subprocess.DEVNULL
-                )
-                self.state.set_process(process)
-                self.state.needs_redraw = True
-                return True
-            except FileNotFoundError:
-                continue
+        # Use absolute path to ensure correct file is played
+        filepath = os.path.join(self._dir_str, filename)
 
-        return False
+        # close_fds=False with an absolute executable and no preexec_fn,
+        # pass_fds or start_new_session lets CPython use posix_spawn()
+        # instead of fork()+exec(). The player inherits our few open fds.
+        try:
+            process = subprocess.Popen(
+                self._player_argv + [filepath],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL,
+                close_fds=False
+            )
+        except OSError:
+            return False
+
+        self.state.mpv_process = process
+        self._last_played = filename
+        self._play_started = time.monotonic()
+        self.status_dirty = True
+        self.state.redraw_event.set()
+        return True
 
     def stop_playback(self):
         """Stop current playback"""
-        process = self.state.get_process()
+        process = self.state.mpv_process
         if process:
+            # Forget the process first so the SIGCHLD handler does not treat
+            # a stopped track as one that finished on its own
+            self.state.mpv_process = None
+            self.status_dirty = True
+            self.state.redraw_event.set()
             try:
                 process.terminate()
                 process.wait(timeout=1)
             except subprocess.TimeoutExpired:
                 process.kill()
-            finally:
-                self.state.set_process(None)
-                self.state.needs_redraw = True
+                process.wait()
 
     def draw_box_with_title(self, y: int, x: int, height: int, width: int, title: str = ""):
         """Draw a box with optional title (nmtui style)"""
@@ -152,14 +299,14 @@ class MediaPlayer:
             self.stdscr.addch(y + height - 1, x + width - 1, curses.ACS_LRCORNER)
 
             # Draw horizontal lines
-            for i in range(1, width - 1):
-                self.stdscr.addch(y, x + i, curses.ACS_HLINE)
-                self.stdscr.addch(y + height - 1, x + i, curses.ACS_HLINE)
+            if width > 2:
+                self.stdscr.hline(y, x + 1, curses.ACS_HLINE, width - 2)
+                self.stdscr.hline(y + height - 1, x + 1, curses.ACS_HLINE, width - 2)
 
             # Draw vertical lines
-            for i in range(1, height - 1):
-                self.stdscr.addch(y + i, x, curses.ACS_VLINE)
-                self.stdscr.addch(y + i, x + width - 1, curses.ACS_VLINE)
+            if height > 2:
+                self.stdscr.vline(y + 1, x, curses.ACS_VLINE, height - 2)
+                self.stdscr.vline(y + 1, x + width - 1, curses.ACS_VLINE, height - 2)
 
             # Add title if provided
             if title:
@@ -170,108 +317,112 @@ class MediaPlayer:
         except curses.error:
             pass  # Ignore drawing errors for small terminals
 
-    def draw_button(self, y: int, x: int, text: str, selected: bool = False):
-        """Draw button (nmtui style)"""
-        try:
-            button_text = f"< {text} >"
-            if selected:
-                self.stdscr.attron(curses.A_REVERSE)
-                self.stdscr.addstr(y, x, button_text)
-                self.stdscr.attroff(curses.A_REVERSE)
-            else:
-                self.stdscr.addstr(y, x, button_text)
-        except curses.error:
-            pass  # Ignore drawing errors
-
-    def draw_interface(self):
-        """Draw the nmtui-style interface"""
-        if not self.state.needs_redraw:
-            return
-
-        term_y, term_x = self.stdscr.getmaxyx()
-        self.stdscr.clear()
+    def directory_display(self, term_x: int) -> str:
+        """Directory line truncated to the terminal width"""
+        dir_info = self._dir_display_cache.get(term_x)
+        if dir_info is None:
+            dir_info = f"Directory: {self._dir_str}"
+            if len(dir_info) > term_x - 4:
+                dir_info = f"Directory: ...{self._dir_str[-term_x+15:]}"
+            dir_info = dir_info[:term_x-3]
+            self._dir_display_cache[term_x] = dir_info
+        return dir_info
+
+    def build_chrome(self, term_y: int, term_x: int) -> List[Tuple[int, int, str]]:
+        """Precompute the static chrome as (y, x, text) rows, in drawing order"""
+        rows = []
 
         # Main title (centered)
         main_title = "Terminal Music Player"
         title_x = (term_x - len(main_title)) // 2
         if title_x >= 0:
-            try:
-                self.stdscr.addstr(1, title_x, main_title)
-            except curses.error:
-                pass
+            rows.append((1, title_x, main_title))
 
         # Directory info
-        dir_info = f"Directory: {self.directory}"
-        if len(dir_info) > term_x - 4:
-            dir_info = f"Directory: ...{str(self.directory)[-term_x+15:]}"
-        try:
-            self.stdscr.addstr(2, 2, dir_info[:term_x-3])
-        except curses.error:
-            pass
+        rows.append((2, 2, self.directory_display(term_x)))
 
-        # Draw main content box
         box_width = term_x - 4
         box_height = term_y - 7  # Account for directory line
-        if box_width > 0 and box_height > 0:
-            self.draw_box_with_title(4, 2, box_height, box_width, "Music Library")
+        if self._unicode_borders:
+            # Main content box, one string per row
+            if box_width > 1 and box_height > 1:
+                inner = box_width - 2
+                top = "┌" + "─" * inner + "┐"
+                title_text = "[ Music Library ]"
+                title_x = (box_width - len(title_text)) // 2
+                if title_x > 0 and title_x + len(title_text) < box_width:
+                    top = top[:title_x] + title_text + top[title_x + len(title_text):]
+                rows.append((4, 2, top))
+                side = "│" + " " * inner + "│"
+                for y in range(5, 4 + box_height - 1):
+                    rows.append((y, 2, side))
+                rows.append((4 + box_height - 1, 2, "└" + "─" * inner + "┘"))
+
+            # Separator line, indented on the left like the ACS version
+            if box_width > 4:
+                sep_len = max(0, box_width - 6)
+                separator = "├   " + "─" * sep_len
+                rows.append((6, 2, separator.ljust(box_width - 1) + "┤"))
 
-        # Status line inside the box
-        is_playing = self.state.get_process() is not None
-        status = (f"Files: {len(self.files)} | Current: {self.highlight + 1} | "
-                 f"Shuffle: {'ON' if self.shuffle_mode else 'OFF'} | "
-                 f"Playing: {'YES' if is_playing else 'NO'}")
+        # Help text at bottom
+        if term_y > 1:
+            help_text = "Use arrow keys to navigate, ENTER to play, SPACE to stop, 's' for shuffle, 'q' to quit"
+            if len(help_text) < term_x - 2:
+                rows.append((term_y - 1, 2, help_text[:term_x - 3]))
+
+        return rows
 
-        if len(status) < box_width - 4:
+    def draw_static(self, term_y: int, term_x: int):
+        """Draw the interface chrome that only changes on resize"""
+        for y, x, text in self.build_chrome(term_y, term_x):
             try:
-                self.stdscr.addstr(5, 4, status)
+                self.stdscr.addstr(y, x, text)
             except curses.error:
                 pass
 
+        if self._unicode_borders:
+            return
+
+        # Without UTF-8 the borders use the terminal's ACS line characters
+        box_width = term_x - 4
+        box_height = term_y - 7
+        if box_width > 0 and box_height > 0:
+            self.draw_box_with_title(4, 2, box_height, box_width, "Music Library")
+
         # Separator line
         if box_width > 4:
             try:
-                for i in range(4, min(box_width - 2, term_x - 4)):
-                    self.stdscr.addch(6, i + 2, curses.ACS_HLINE)
+                sep_len = min(box_width - 2, term_x - 4) - 4
+                if sep_len > 0:
+                    self.stdscr.hline(6, 6, curses.ACS_HLINE, sep_len)
                 self.stdscr.addch(6, 2, curses.ACS_LTEE)
                 if box_width + 1 < term_x:
                     self.stdscr.addch(6, box_width + 1, curses.ACS_RTEE)
             except curses.error:
                 pass
 
-        # File list area
-        list_start_y = 7
-        list_height = box_height - 6
-        display_count = max(1, list_height)
-
-        for i in range(display_count):
-            file_idx = self.start_index + i
-            if file_idx >= len(self.files):
-                break
-
-            y_pos = list_start_y + i
-            if y_pos >= term_y - 3:
-                break
-
-            # Truncate filename to fit
-            max_name_len = max(10, box_width - 10)
-            filename = self.files[file_idx]
-            if len(filename) > max_name_len:
-                display_name = filename[:max_name_len - 3] + "..."
-            else:
-                display_name = filename
+    def draw_status(self, term_y: int, term_x: int):
+        """Draw the status line and control buttons"""
+        box_width = term_x - 4
 
+        # Status line inside the box
+        fields = [f"Files: {len(self.files)}",
+                  f"Current: {self.highlight + 1}",
+                  f"Shuffle: {self._shuffle_label()}",
+                  f"Playing: {'YES' if self.state.is_playing else 'NO'}"]
+        status_width = box_width - 5
+
+        # The screen isn't cleared between frames, so the row is always
+        # rewritten: fields that don't fit are dropped from the right
+        # rather than leaving a stale status behind
+        status = " | ".join(fields)
+        while len(status) > status_width and fields:
+            fields.pop()
+            status = " | ".join(fields)
+        if status_width > 0:
             try:
-                if self.highlight == file_idx:
-                    # Highlighted selection
-                    self.stdscr.attron(curses.A_REVERSE)
-                    line_text = f" * {display_name}"
-                    # Fill the rest of the line with spaces
-                    padding = " " * max(0, box_width - 6 - len(line_text))
-                    self.stdscr.addstr(y_pos, 4, (line_text + padding)[:term_x-5])
-                    self.stdscr.attroff(curses.A_REVERSE)
-                else:
-                    line_text = f"   {display_name}"
-                    self.stdscr.addstr(y_pos, 4, line_text[:term_x-5])
+                # Pad so a shorter status overwrites the previous one
+                self.stdscr.addstr(5, 4, status.ljust(status_width))
             except curses.error:
                 pass
 
@@ -289,25 +440,196 @@ class MediaPlayer:
                 ("Quit", False)
             ]
 
+            # Build the whole row (nmtui style buttons) and draw it at once,
+            # then highlight the selected buttons in place
+            row = ""
+            selected_spans = []
             for i, (text, selected) in enumerate(buttons):
                 x_pos = start_x + button_spacing * i
-                if x_pos + len(text) + 4 < term_x:
-                    self.draw_button(button_y, x_pos, text, selected)
+                if x_pos + len(text) + 4 >= term_x:
+                    break
+                button_text = f"< {text} >"
+                row = row.ljust(x_pos - start_x) + button_text
+                if selected:
+                    selected_spans.append((x_pos, len(button_text)))
 
-        # Help text at bottom
-        if term_y > 1:
-            help_text = "Use arrow keys to navigate, ENTER to play, SPACE to stop, 's' for shuffle, 'q' to quit"
-            if len(help_text) < term_x - 2:
-                try:
-                    self.stdscr.addstr(term_y - 1, 2, help_text[:term_x - 3])
-                except curses.error:
-                    pass
+            try:
+                self.stdscr.addstr(button_y, start_x, row)
+                for x_pos, length in selected_spans:
+                    self.stdscr.chgat(button_y, x_pos, length, curses.A_REVERSE)
+            except curses.error:
+                pass  # Ignore drawing errors
+
+    def draw_row(self, file_idx: int):
+        """Draw a single file list row into the list pad"""
+        if self._pad is None or not 0 <= file_idx < len(self.files):
+            return
+
+        display_name = self._display_names[file_idx]
+
+        # Pad to the full width so the highlight spans the row and a
+        # shorter line covers a longer one
+        selected = self.highlight == file_idx
+        line = f"{' * ' if selected else '   '}{display_name}".ljust(self._pad_width)[:self._pad_width]
+        try:
+            self._pad.addstr(file_idx, 0, line, curses.A_REVERSE if selected else curses.A_NORMAL)
+        except curses.error:
+            pass
+
+    def build_list_pad(self, term_x: int):
+        """Render every file into an off-screen pad sized for the terminal"""
+        self._pad_width = term_x - 10  # Inside the box, from column 4
+        self._pad = None
+        self._drawn_highlight = None
+        if self._pad_width < 1:
+            return
+
+        # Truncate filenames to fit, once per width
+        if self._display_names_width != self._pad_width:
+            max_name_len = max(10, self._pad_width - 4)
+            self._display_names = [
+                (f[:max_name_len - 3] + "...") if len(f) > max_name_len else f
+                for f in self.files
+            ]
+            self._display_names_width = self._pad_width
+
+        # One spare row so writing the last file never hits the
+        # bottom-right corner of the pad
+        self._pad = curses.newpad(len(self.files) + 1, self._pad_width)
+        for file_idx in range(len(self.files)):
+            self.draw_row(file_idx)
+        self._drawn_highlight = self.highlight
+
+    def draw_file_list(self):
+        """Update the highlight in the list pad"""
+        if self._drawn_highlight is not None and self._drawn_highlight != self.highlight:
+            # Only the old and new rows change, the pad keeps the rest
+            self.draw_row(self._drawn_highlight)
+            self.draw_row(self.highlight)
+        self._drawn_highlight = self.highlight
+
+    def refresh_file_list(self, term_y: int):
+        """Copy the visible slice of the list pad to the virtual screen"""
+        if self._pad is None:
+            return
+
+        list_start_y = 7
+        display_count = max(1, term_y - 13)
+        visible = min(display_count, len(self.files) - self.start_index)
+        list_end_y = min(list_start_y + visible - 1, term_y - 4)
+        if list_end_y < list_start_y:
+            return
 
         try:
-            self.stdscr.refresh()
+            self._pad.noutrefresh(self.start_index, 0,
+                                  list_start_y, 4,
+                                  list_end_y, 4 + self._pad_width - 1)
         except curses.error:
             pass
-        self.state.needs_redraw = False
+
+    def probe_synchronized_output(self) -> bool:
+        """Ask the terminal whether it supports synchronized output.
+
+        The DECRQM query is followed by DA1, which every terminal answers,
+        so reading up to the DA1 reply also consumes a slow DECRQM reply.
+        Keys typed meanwhile are pushed back for the main loop.
+        """
+        try:
+            sys.stdout.write(SYNC_OUTPUT_QUERY + DA1_QUERY)
+            sys.stdout.flush()
+        except OSError:
+            return False
+
+        # Keypad mode (enabled by curses.wrapper) stays on: typed keys are
+        # decoded as usual and can be pushed back as key codes, while the
+        # replies match no key and come through as raw bytes.
+        # A terminal that stays silent only costs the short first wait;
+        # a reply too late for it is dropped later by read_keys().
+        self.stdscr.timeout(SYNC_PROBE_FIRST_BYTE_MS)
+        deadline = time.monotonic() + SYNC_PROBE_MAX_SECONDS
+        replying = False
+
+        # Replies have the form CSI ? ... final byte. DECRQM answers
+        # CSI ? 2026 ; Ps $ y, where Ps 1/2 means supported; DA1 ends in c.
+        supported = False
+        seq = ""
+        other: List[int] = []
+        while time.monotonic() < deadline:
+            ch = self.stdscr.getch()
+            if ch == curses.ERR:
+                break
+
+            if not seq:
+                if ch == 27:
+                    seq = "\x1b"
+                else:
+                    other.append(ch)
+                continue
+
+            seq += chr(ch)
+            if not replying and seq == "\x1b[?":
+                replying = True
+                self.stdscr.timeout(SYNC_PROBE_TIMEOUT_MS)
+            if not "\x1b[?".startswith(seq[:3]):
+                # Not a terminal report, e.g. an Esc key press
+                other.extend(ord(c) for c in seq)
+                seq = ""
+            elif len(seq) > 3 and 0x40 <= ch <= 0x7e:
+                if seq.startswith("\x1b[?2026;") and seq.endswith("$y"):
+                    supported = seq[len("\x1b[?2026;")] in "12"
+                elif seq.endswith("c"):
+                    break  # DA1 reply, nothing else is coming
+                seq = ""
+
+        other.extend(ord(c) for c in seq)
+        # ungetch is last in, first out
+        for ch in reversed(other):
+            curses.ungetch(ch)
+
+        return supported
+
+    def flush_frame(self):
+        """Send pending screen changes to the terminal as a single frame"""
+        try:
+            self.stdscr.noutrefresh()
+            # After stdscr, so the list is not covered by its blank cells
+            self.refresh_file_list(self.stdscr.getmaxyx()[0])
+            if self._sync_output:
+                sys.stdout.buffer.write(SYNC_OUTPUT_BEGIN)
+                sys.stdout.buffer.flush()
+            curses.doupdate()
+            if self._sync_output:
+                sys.stdout.buffer.write(SYNC_OUTPUT_END)
+                sys.stdout.buffer.flush()
+        except (curses.error, OSError):
+            pass
+
+    def draw_interface(self):
+        """Draw the nmtui-style interface"""
+        if not self.state.redraw_event.is_set():
+            return
+
+        term_y, term_x = self.stdscr.getmaxyx()
+        if (term_y, term_x) != self._last_size:
+            # Geometry changed: start from a blank screen and redraw everything.
+            # Otherwise curses' own damage tracking only sends changed cells.
+            self._last_size = (term_y, term_x)
+            self.stdscr.erase()
+            self.draw_static(term_y, term_x)
+            self.build_list_pad(term_x)
+            self.status_dirty = True
+            self.list_dirty = False
+
+        if self.status_dirty:
+            self.status_dirty = False
+            self.draw_status(term_y, term_x)
+
+        if self.list_dirty:
+            self.list_dirty = False
+            self.draw_file_list()
+
+        self.flush_frame()
+        self.state.redraw_event.clear()
 
     def update_scroll(self, display_count: int):
         """Update scroll position"""
@@ -318,16 +640,166 @@ class MediaPlayer:
 
         self.start_index = max(0, self.start_index)
 
+    def _next_shuffle_index(self) -> int:
+        """Next file index from the shuffled play order"""
+        if not self._shuffle_order:
+            self._shuffle_order = list(range(len(self.files)))
+            self._rng.shuffle(self._shuffle_order)
+            # Don't start a new round with the track that just played
+            if (len(self._shuffle_order) > 1
+                    and self.files[self._shuffle_order[-1]] == self._last_played):
+                self._shuffle_order[0], self._shuffle_order[-1] = \
+                    self._shuffle_order[-1], self._shuffle_order[0]
+        return self._shuffle_order.pop()
+
+    def _shuffle_label(self) -> str:
+        """Shuffle field of the status line"""
+        if self.shuffle_mode:
+            return 'ON'
+        return 'OFF (tracks failing)' if self._shuffle_gave_up else 'OFF'
+
+    def _schedule_next_shuffle(self):
+        """Pick when shuffle plays the next track after one has ended.
+
+        Tracks that fail straight away are spaced MIN_TRACK_SECONDS apart,
+        and after MAX_SHUFFLE_FAILURES of them in a row shuffle is turned off.
+        """
+        now = time.monotonic()
+        if now - self._play_started >= MIN_TRACK_SECONDS and not self._last_returncode:
+            self._shuffle_failures = 0
+            self._shuffle_resume_at = now
+            return
+
+        self._shuffle_failures += 1
+        if self._shuffle_failures >= MAX_SHUFFLE_FAILURES:
+            self.shuffle_mode = False
+            self._shuffle_gave_up = True
+            self._shuffle_failures = 0
+            self._shuffle_resume_at = None
+            self.status_dirty = True
+        else:
+            self._shuffle_resume_at = self._play_started + MIN_TRACK_SECONDS
+
     def play_random_file(self, display_count: int):
         """Play random file"""
         if not self.files:
             return
 
-        random_index = random.randint(0, len(self.files) - 1)
+        if self.shuffle_mode:
+            random_index = self._next_shuffle_index()
+        else:
+            random_index = self._rng.randrange(len(self.files))
         self.play_file(self.files[random_index])
         self.highlight = random_index
         self.update_scroll(display_count)
-        self.state.needs_redraw = True
+        self.status_dirty = True
+        self.list_dirty = True
+        self.state.redraw_event.set()
+
+    def read_keys(self) -> List[int]:
+        """Wait for a key, then collect any others that are already queued"""
+        ch = self.stdscr.getch()
+        if ch == curses.ERR:
+            return []
+
+        keys = [ch]
+        self.stdscr.nodelay(True)
+        while len(keys) < MAX_PENDING_KEYS:
+            ch = self.stdscr.getch()
+            if ch == curses.ERR:
+                break
+            keys.append(ch)
+        return self._drop_terminal_reports(keys)
+
+    @staticmethod
+    def _drop_terminal_reports(keys: List[int]) -> List[int]:
+        """Remove CSI ? ... reports that arrived after the startup probe.
+
+        Their leading ESC would otherwise be taken as Quit.
+        """
+        result = []
+        i = 0
+        while i < len(keys):
+            if keys[i:i + 3] == [27, ord('['), ord('?')]:
+                i += 3
+                while i < len(keys) and not 0x40 <= keys[i] <= 0x7e:
+                    i += 1
+                i += 1  # Final byte
+                continue
+            result.append(keys[i])
+            i += 1
+        return result
+
+    def handle_key(self, ch: int, display_count: int) -> bool:
+        """Apply a key press to the player state without drawing.
+
+        Returns False when the key asks to quit.
+        """
+        if ch == curses.KEY_UP:
+            self.list_dirty = True
+            if self.highlight > 0:
+                self.highlight -= 1
+                self.update_scroll(display_count)
+
+        elif ch == curses.KEY_DOWN:
+            self.list_dirty = True
+            if self.highlight < len(self.files) - 1:
+                self.highlight += 1
+                self.update_scroll(display_count)
+
+        elif ch == curses.KEY_PPAGE:  # Page Up
+            self.list_dirty = True
+            self.highlight = max(0, self.highlight - display_count)
+            self.update_scroll(display_count)
+
+        elif ch == curses.KEY_NPAGE:  # Page Down
+            self.list_dirty = True
+            self.highlight = min(len(self.files) - 1, self.highlight + display_count)
+            self.update_scroll(display_count)
+
+        elif ch == curses.KEY_HOME:
+            self.list_dirty = True
+            self.highlight = 0
+            self.start_index = 0
+
+        elif ch == curses.KEY_END:
+            self.list_dirty = True
+            self.highlight = len(self.files) - 1
+            self.update_scroll(display_count)
+
+        elif ch in (10, 13):  # Enter
+            self.shuffle_mode = False
+            self._shuffle_gave_up = False
+            if self.files:
+                self.play_file(self.files[self.highlight])
+
+        elif ch == ord(' '):  # Space to stop
+            self.stop_playback()
+
+        elif ch in (ord('s'), ord('S')):  # Toggle shuffle
+            self.shuffle_mode = not self.shuffle_mode
+            self._shuffle_order = []
+            self._shuffle_gave_up = False
+            self._shuffle_failures = 0
+            self._shuffle_resume_at = None
+            if self.shuffle_mode and not self.state.is_playing:
+                self.play_random_file(display_count)
+
+        elif ch in (ord('r'), ord('R')):  # Random play
+            self.play_random_file(display_count)
+
+        elif ch == curses.KEY_RESIZE:
+            pass  # Picked up by the size check in draw_interface
+
+        elif ch in (ord('q'), ord('Q'), 27):  # Quit
+            return False
+
+        else:
+            return True  # Unhandled key, nothing to redraw
+
+        self.status_dirty = True
+        self.state.redraw_event.set()
+        return True
 
     def run(self, stdscr):
         """Main application loop"""
@@ -345,85 +817,65 @@ class MediaPlayer:
         curses.noecho()
         curses.cbreak()
         curses.curs_set(0)
-        stdscr.keypad(True)
-        stdscr.nodelay(True)
+        # Keep ncurses' output optimization even while keys are arriving
+        curses.typeahead(-1)
+        self._sync_output = self.probe_synchronized_output()
 
-        random.seed()
+        # A finished player interrupts the blocking getch below
+        previous_sigchld = signal.signal(signal.SIGCHLD, self._on_sigchld)
 
         # Main event loop
         while True:
             term_y, term_x = stdscr.getmaxyx()
             display_count = max(1, term_y - 13)  # Account for directory line
 
-            self.draw_interface()
-
             # Handle child process completion
             if self.state.child_finished:
                 self.state.child_finished = False
+                self.state.redraw_event.set()
                 if self.shuffle_mode:
+                    self._schedule_next_shuffle()
+            if (self._shuffle_resume_at is not None
+                    and time.monotonic() >= self._shuffle_resume_at):
+                self._shuffle_resume_at = None
+                if self.shuffle_mode and not self.state.is_playing:
                     self.play_random_file(display_count)
 
-            # Handle user input
-            try:
-                ch = stdscr.getch()
-                if ch != curses.ERR:
-                    self.state.needs_redraw = True
-
-                    if ch == curses.KEY_UP:
-                        if self.highlight > 0:
-                            self.highlight -= 1
-                            self.update_scroll(display_count)
-
-                    elif ch == curses.KEY_DOWN:
-                        if self.highlight < len(self.files) - 1:
-                            self.highlight += 1
-                            self.update_scroll(display_count)
-
-                    elif ch == curses.KEY_PPAGE:  # Page Up
-                        self.highlight = max(0, self.highlight - display_count)
-                        self.update_scroll(display_count)
-
-                    elif ch == curses.KEY_NPAGE:  # Page Down
-                        self.highlight = min(len(self.files) - 1, self.highlight + display_count)
-                        self.update_scroll(display_count)
-
-                    elif ch == curses.KEY_HOME:
-                        self.highlight = 0
-                        self.start_index = 0
-
-                    elif ch == curses.KEY_END:
-                        self.highlight = len(self.files) - 1
-                        self.update_scroll(display_count)
-
-                    elif ch in (10, 13):  # Enter
-                        self.shuffle_mode = False
-                        if self.files:
-                            self.play_file(self.files[self.highlight])
-
-                    elif ch == ord(' '):  # Space to stop
-                        self.stop_playback()
-
-                    elif ch in (ord('s'), ord('S')):  # Toggle shuffle
-                        self.shuffle_mode = not self.shuffle_mode
-                        if self.shuffle_mode and not self.state.get_process():
-                            self.play_random_file(display_count)
+            self.draw_interface()
 
-                    elif ch in (ord('r'), ord('R')):  # Random play
-                        self.play_random_file(display_count)
+            # getch blocks until a key arrives or the timeout expires, so the
+            # loop only wakes often when a finished track needs handling
+            if self.shuffle_mode or self.state.is_playing:
+                stdscr.timeout(INPUT_TIMEOUT_MS)
+            else:
+                stdscr.timeout(IDLE_INPUT_TIMEOUT_MS)
 
-                    elif ch in (ord('q'), ord('Q'), 27):  # Quit
+            # Handle user input. Every key already queued is applied before
+            # the next draw, so a held arrow key only redraws once per batch.
+            quit_requested = False
+            try:
+                keys = self.read_keys()
+                if not keys:
+                    # A player that exits before Popen returns and its process
+                    # is stored is missed by the SIGCHLD handler, so poll on
+                    # each timeout as well
+                    self._check_player_exit()
+                for ch in keys:
+                    if ch == curses.KEY_RESIZE:
+                        # Keys after a resize in the same batch scroll
+                        # against the new list height
+                        display_count = max(1, stdscr.getmaxyx()[0] - 13)
+                    if not self.handle_key(ch, display_count):
+                        quit_requested = True
                         break
-
-                    else:
-                        self.state.needs_redraw = False
-
             except KeyboardInterrupt:
+                quit_requested = True
+            if quit_requested:
                 break
 
-            time.sleep(REFRESH_DELAY)
-
         # Cleanup
         self.stop_playback()
+        signal.signal(signal.SIGCHLD, previous_sigchld)
         return None
 
 def parse_arguments():